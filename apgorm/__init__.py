@@ -30,7 +30,7 @@ https://github.com/TrigonDev/apgorm
 
 from importlib import metadata
 
-from . import exceptions
+from . import exceptions, validators
 from .connection import Connection, Pool, PoolAcquireContext
 from .constraints.check import Check
 from .constraints.constraint import Constraint
@@ -132,4 +132,5 @@ __all__ = (
     "migrations",
     "exceptions",
     "undefined",
+    "validators",
 )
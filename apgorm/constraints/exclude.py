@@ -35,7 +35,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Exclude(Constraint):
-    __slots__: Iterable[str] = ("using", "elements", "where")
+    __slots__: Iterable[str] = (
+        "using",
+        "elements",
+        "where",
+        "_creation_sql_cache",
+    )
 
     def __init__(
         self,
@@ -61,8 +66,24 @@ class Exclude(Constraint):
             (raw(f) if isinstance(f, str) else f, op) for f, op in elements
         ]
         self.where = raw(where) if isinstance(where, str) else where
+        self._creation_sql_cache: tuple[
+            tuple[Any, ...], Block[Any]
+        ] | None = None
 
     def _creation_sql(self) -> Block[Any]:
+        # the name is populated later by Model, and the other attributes may
+        # be reassigned, so all of them are part of the key
+        key = (self.name, self.using, tuple(self.elements), self.where)
+        if (
+            self._creation_sql_cache is None
+            or self._creation_sql_cache[0] != key
+        ):
+            self._creation_sql_cache = (key, self._build_creation_sql())
+        # Block() shares the cached pieces, so += on the result can't
+        # modify the cache
+        return Block(self._creation_sql_cache[1])
+
+    def _build_creation_sql(self) -> Block[Any]:
         sql = Block[Any](
             raw("CONSTRAINT"),
             raw(self.name),
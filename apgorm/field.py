@@ -168,7 +168,8 @@ class Field(BaseField[_F, _T, _T]):
             return inst._raw_values[self.name]
 
         def __set__(self, inst, value):
-            self._validate(value)
+            if self._validators:
+                self._validate(value)
             inst._raw_values[self.name] = value
             inst._changed_fields.add(self.name)
 
@@ -215,6 +216,7 @@ class ConverterField(BaseField[_F, _T, _C]):
             return self.converter.from_stored(inst._raw_values[self.name])
 
         def __set__(self, inst, value):
-            self._validate(value)
+            if self._validators:
+                self._validate(value)
             inst._raw_values[self.name] = self.converter.to_stored(value)
             inst._changed_fields.add(self.name)
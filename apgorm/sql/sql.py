@@ -22,7 +22,9 @@
 
 from __future__ import annotations
 
-from collections import UserString
+import threading
+from functools import lru_cache
+from itertools import chain, count, islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -75,6 +77,11 @@ bigint: CASTED[BigInt] = sql(1).cast(SmallInt())  # fails
 ```
 """
 
+_RENDER_CACHE: dict[tuple[str | None, ...], tuple[str, tuple[int, ...]]] = {}
+_RENDER_CACHE_SIZE = 1024
+_RENDER_CACHE_LOCK = threading.Lock()
+_PLACEHOLDERS = tuple(f"${i}" for i in range(257))
+
 
 @overload
 def sql(piece: CASTED[_SQLT_CO], /, *, wrap: bool = ...) -> Block[_SQLT_CO]:
@@ -137,11 +144,12 @@ def join(
         False.
     """
 
-    new_values: list[SQL[Any]] = []
-    for x, v in enumerate(values):
-        new_values.append(v)
-        if x != len(values) - 1:
-            new_values.append(joiner)
+    if not values:
+        return sql(wrap=wrap)
+
+    # start with only joiners, then put the values in every other slot
+    new_values: list[SQL[Any]] = [joiner] * (2 * len(values) - 1)
+    new_values[0::2] = values
     return sql(*new_values, wrap=wrap)
 
 
@@ -170,14 +178,30 @@ def raw(string: str) -> Block[Any]:
     ```
     """
 
-    return sql(Raw(string))
+    return Block._from_parallel(*_raw_parallel(string), shared=True)
 
 
-class Raw(UserString):
-    __slots__: Iterable[str] = ()
+# only the pieces are cached, so each call to raw() still gets its own Block.
+# The Blocks are marked as shared, so the cached lists are never modified.
+@lru_cache(maxsize=2048, typed=True)
+def _raw_parallel(string: Any) -> tuple[list[str | None], list[Any]]:
+    return [str(string)], [None]
+
+
+class Raw:
+    __slots__: Iterable[str] = ("data",)
+
+    def __init__(self, data: str) -> None:
+        self.data = str(data)
+
+    def __str__(self) -> str:
+        return self.data
 
 
 class Parameter(Generic[_T]):
+    """Marks a value as a parameter. Blocks store only the value itself, so
+    this is unwrapped as soon as it is passed to a Block."""
+
     __slots__: Iterable[str] = ("value",)
 
     def __init__(self, value: _T) -> None:
@@ -245,7 +269,13 @@ class Comparable:
 class Block(Comparable, Generic[_SQLT_CO]):
     """Represents a list of raw sql and parameters."""
 
-    __slots__: Iterable[str] = ("_pieces", "_wrap")
+    __slots__: Iterable[str] = (
+        "_raws",
+        "_params",
+        "_wrap",
+        "_compiled",
+        "_shared",
+    )
 
     def __init__(self, *pieces: SQL[Any] | Raw, wrap: bool = False) -> None:
         """Create a Block. You may find it more convienient to use the `sql()`
@@ -262,25 +292,62 @@ class Block(Comparable, Generic[_SQLT_CO]):
         ```
         """
 
-        self._pieces: list[Raw | Parameter[Any]] = []
+        # _raws and _params are parallel: at each position, _raws holds the
+        # raw sql, or None if that position is a parameter, in which case
+        # _params holds the parameter's value. If _shared is True, the lists
+        # may be used by another Block and must be copied before modifying.
+        self._raws: list[str | None]
+        self._params: list[Any]
+        self._compiled: tuple[str, tuple[int, ...]] | None
+        self._shared: bool
 
         if len(pieces) == 1 and isinstance(pieces[0], Block):
             block = pieces[0]
             assert isinstance(block, Block)
             self._wrap: bool = block._wrap or wrap
-            self._pieces = block._pieces
+            self._raws = block._raws
+            self._params = block._params
+            self._compiled = block._compiled
+            self._shared = block._shared = True
 
         else:
             self._wrap = wrap
+            raws: list[str | None] = []
+            params: list[Any] = []
             for p in pieces:
                 if isinstance(p, Comparable):
-                    p = p._get_block()
-                if isinstance(p, Block):
-                    self._pieces.extend(p.get_pieces())
-                elif isinstance(p, (Raw, Parameter)):
-                    self._pieces.append(p)
+                    block = p if type(p) is Block else p._get_block()
+                    block._extend_into(raws, params)
+                elif isinstance(p, Raw):
+                    raws.append(p.data)
+                    params.append(None)
+                elif isinstance(p, Parameter):
+                    raws.append(None)
+                    params.append(p.value)
                 else:
-                    self._pieces.append(Parameter(p))
+                    raws.append(None)
+                    params.append(p)
+            self._raws = raws
+            self._params = params
+            self._compiled = None
+            self._shared = False
+
+    @classmethod
+    def _from_parallel(
+        cls,
+        raws: list[str | None],
+        params: list[Any],
+        wrap: bool = False,
+        shared: bool = False,
+    ) -> Block[Any]:
+        # skips the type checks in __init__ when the pieces are already known
+        block = cls.__new__(cls)
+        block._raws = raws
+        block._params = params
+        block._wrap = wrap
+        block._compiled = None
+        block._shared = shared
+        return block
 
     def render(self) -> tuple[str, list[Any]]:
         """Return the rendered result of the Block.
@@ -290,7 +357,29 @@ class Block(Comparable, Generic[_SQLT_CO]):
             parameters.
         """
 
-        return Renderer().render(self)
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compile()
+            self._compiled = compiled
+
+        return compiled[0], list(map(self._params.__getitem__, compiled[1]))
+
+    def _compile(self) -> tuple[str, tuple[int, ...]]:
+        # blocks with the same structure (raw sql and parameter positions)
+        # always render to the same sql, so the result is shared between them
+        key = tuple(self._raws)
+        compiled = _RENDER_CACHE.get(key)
+        if compiled is None:
+            compiled = (
+                _render_raws(key),
+                tuple(i for i, r in enumerate(key) if r is None),
+            )
+            with _RENDER_CACHE_LOCK:
+                if len(_RENDER_CACHE) >= _RENDER_CACHE_SIZE:
+                    # evicts the oldest inserted entry (FIFO, not LRU)
+                    del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
+                _RENDER_CACHE[key] = compiled
+        return compiled
 
     def render_no_params(self) -> str:
         """Convenience function to get the SQL but not the parameters.
@@ -307,22 +396,53 @@ class Block(Comparable, Generic[_SQLT_CO]):
     def get_pieces(
         self, force_wrap: bool | None = None
     ) -> list[Raw | Parameter[Any]]:
+        raws: list[str | None] = []
+        params: list[Any] = []
+        self._extend_into(raws, params, force_wrap)
+        return [
+            Parameter(v) if r is None else Raw(r) for r, v in zip(raws, params)
+        ]
+
+    def _extend_into(
+        self,
+        raws: list[str | None],
+        params: list[Any],
+        force_wrap: bool | None = None,
+    ) -> None:
         wrap = self._wrap if force_wrap is None else force_wrap
         if wrap:
-            return [Raw("("), *self._pieces, Raw(")")]
-        return self._pieces
+            raws.append("(")
+            params.append(None)
+        raws.extend(self._raws)
+        params.extend(self._params)
+        if wrap:
+            raws.append(")")
+            params.append(None)
 
     def _get_block(self) -> Block[Any]:
         return self
 
+    def _own_pieces(self) -> None:
+        # copy-on-write: copy the lists if another Block may be using them
+        if self._shared:
+            self._raws = list(self._raws)
+            self._params = list(self._params)
+            self._shared = False
+
     def __iadd__(self, other: object) -> Block[Any]:
         if isinstance(other, Block):
-            self._pieces.extend(other.get_pieces())
+            if other is self:
+                other = Block(self)
+            self._own_pieces()
+            other._extend_into(self._raws, self._params)
         elif isinstance(other, Parameter):
-            self._pieces.append(other)
+            self._own_pieces()
+            self._raws.append(None)
+            self._params.append(other.value)
         else:
             raise TypeError(f"Unsupported type {type(other)}")
 
+        self._compiled = None
         return self
 
 
@@ -332,20 +452,17 @@ class Renderer:
     def __init__(self) -> None:
         self._curr_value_id: int = 0
 
-    @property
-    def _next_value_id(self) -> int:
-        self._curr_value_id += 1
-        return self._curr_value_id
-
     def render(self, sql: Block[Any]) -> tuple[str, list[Any]]:
-        sql_pieces: list[str] = []
-        params: list[Any] = []
+        params = [v for r, v in zip(sql._raws, sql._params) if r is None]
+        rendered = _render_raws(sql._raws, self._curr_value_id + 1)
+
+        self._curr_value_id += len(params)
+        return rendered, params
 
-        for piece in sql.get_pieces(force_wrap=False):
-            if isinstance(piece, Raw):
-                sql_pieces.append(str(piece))
-            else:
-                sql_pieces.append(f"${self._next_value_id}")
-                params.append(piece.value)
 
-        return " ".join(sql_pieces), params
+def _render_raws(raws: Iterable[str | None], start: int = 1) -> str:
+    placeholders = chain(
+        islice(_PLACEHOLDERS, start, None),
+        map("${}".format, count(max(start, len(_PLACEHOLDERS)))),
+    )
+    return " ".join([next(placeholders) if r is None else r for r in raws])
@@ -64,6 +64,8 @@ class VarBit(SqlType[asyncpg.BitString]):
     https://www.postgresql.org/docs/14/datatype-bit.html
     """
 
+    __slots__: Iterable[str] = ("_max_length",)
+
     def __init__(self, max_length: int | None = None) -> None:
         """Create a VarBit type.
 
@@ -67,6 +67,8 @@ class Char(SqlType[str]):
     https://www.postgresql.org/docs/14/datatype-character.html
     """
 
+    __slots__: Iterable[str] = ("_length",)
+
     def __init__(self, length: int | None = None) -> None:
         self._length = length
         self._sql = "CHAR"
@@ -90,4 +92,6 @@ class Text(SqlType[str]):
     https://www.postgresql.org/docs/14/datatype-character.html
     """
 
+    __slots__: Iterable[str] = ()
+
     _sql = "TEXT"
@@ -0,0 +1,57 @@
+# MIT License
+#
+# Copyright (c) 2021 TrigonDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .field import VALIDATOR
+
+
+def endswith_any(
+    *suffixes: str, none_ok: bool = False
+) -> VALIDATOR[str | None]:
+    """Return a validator that checks that a value ends with any of the
+    suffixes.
+    ```
+    class User(Model):
+        email = VarChar(32).nullablefield()
+        email.add_validator(endswith_any("@gmail.com", none_ok=True))
+    ```
+
+    Args:
+        *suffixes (str): The allowed suffixes.
+
+    Kwargs:
+        none_ok (bool): Whether or not None is a valid value. Defaults to
+        False.
+    """
+
+    suffixes_tuple = tuple(suffixes)
+
+    def validator(value: str | None) -> bool:
+        if value is None:
+            return none_ok
+        return value.endswith(suffixes_tuple)
+
+    return validator
@@ -27,18 +27,13 @@ from pathlib import Path
 import apgorm
 from apgorm.exceptions import InvalidFieldValue
 from apgorm.types import VarChar
-
-
-def email_validator(email: str | None) -> bool:
-    if email is None or email.endswith("@gmail.com"):
-        return True
-    raise InvalidFieldValue("Email must be None or end with @gmail.com")
+from apgorm.validators import endswith_any
 
 
 class User(apgorm.Model):
     username = VarChar(32).field()
     email = VarChar(32).nullablefield()
-    email.add_validator(email_validator)
+    email.add_validator(endswith_any("@gmail.com", none_ok=True))
 
     primary_key = (username,)
 
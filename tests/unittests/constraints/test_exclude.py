@@ -0,0 +1,81 @@
+# MIT License
+#
+# Copyright (c) 2021 TrigonDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+from apgorm import Exclude, IndexType
+from apgorm.sql.sql import raw
+
+
+def _exclude() -> Exclude:
+    e = Exclude(("x", "="), using=IndexType.GIST, where="y > 1")
+    e.name = "myexclude"
+    return e
+
+
+def test_creation_sql():
+    assert _exclude()._creation_sql().render() == (
+        "CONSTRAINT myexclude EXCLUDE USING GIST ( x WITH = ) "
+        "WHERE ( y > 1 )",
+        [],
+    )
+
+
+def test_creation_sql_cached():
+    e = _exclude()
+    assert e._creation_sql()._raws is e._creation_sql()._raws
+
+
+def test_creation_sql_rename():
+    e = _exclude()
+    first = e._creation_sql()
+    e.name = "renamed"
+    second = e._creation_sql()
+
+    assert second is not first
+    assert second.render_no_params().startswith("CONSTRAINT renamed ")
+
+
+def test_creation_sql_reassign():
+    e = _exclude()
+    e._creation_sql()
+    e.where = raw("z > 2")
+
+    assert e._creation_sql().render_no_params().endswith("WHERE ( z > 2 )")
+
+
+def test_creation_sql_elements_changed():
+    e = _exclude()
+    e._creation_sql()
+    e.elements.append((raw("y"), "&&"))
+
+    assert "( x WITH = ) , ( y WITH && )" in (
+        e._creation_sql().render_no_params()
+    )
+
+
+def test_creation_sql_iadd_does_not_modify_cache():
+    e = _exclude()
+    sql = e._creation_sql()
+    sql += raw("DEFERRABLE")
+
+    assert "DEFERRABLE" not in e._creation_sql().render_no_params()
@@ -0,0 +1,182 @@
+# MIT License
+#
+# Copyright (c) 2021 TrigonDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from apgorm.sql.sql import (
+    _RENDER_CACHE,
+    Block,
+    Parameter,
+    Raw,
+    Renderer,
+    join,
+    raw,
+    sql,
+    wrap,
+)
+
+
+@pytest.mark.parametrize(
+    "values,expected", [((), ""), ((1,), "$1"), ((1, 2, 3), "$1 , $2 , $3")]
+)
+def test_join(values, expected):
+    assert join(raw(","), *values).render() == (expected, list(values))
+
+
+def test_join_wrap():
+    assert sql(join(raw("AND"), 1, 2, wrap=True), 3).render() == (
+        "( $1 AND $2 ) $3",
+        [1, 2, 3],
+    )
+
+
+def test_render_cache():
+    first = sql(raw("SELECT * FROM t WHERE id ="), 1).render()
+    second = sql(raw("SELECT * FROM t WHERE id ="), 2).render()
+
+    assert first == ("SELECT * FROM t WHERE id = $1", [1])
+    assert second == ("SELECT * FROM t WHERE id = $1", [2])
+    assert _RENDER_CACHE[("SELECT * FROM t WHERE id =", None)] == (
+        first[0],
+        (1,),
+    )
+
+
+def test_raw_cached():
+    first, second = raw("SELECT"), raw("SELECT")
+
+    assert first is not second
+    assert first._raws is second._raws
+
+
+def test_iadd_in_place():
+    block = sql(raw("SELECT"))
+    alias = block
+    block += sql(1)
+
+    assert alias is block
+    assert alias.render() == ("SELECT $1", [1])
+
+
+def test_iadd_does_not_mutate_shared():
+    block = raw("SELECT")
+    copy = Block(block)
+    for i in range(3):
+        block += sql(raw(","), i)
+
+    assert block.render() == ("SELECT , $1 , $2 , $3", [0, 1, 2])
+    assert copy.render() == ("SELECT", [])
+    assert raw("SELECT").render() == ("SELECT", [])
+    assert block._raws is not raw("SELECT")._raws
+
+
+def test_iadd_self():
+    block = wrap(1)
+    block += block
+
+    assert block.render() == ("$1 ( $2 )", [1, 1])
+
+
+def test_render_many_params():
+    values = list(range(300))
+    q, params = join(raw(","), *values).render()
+
+    assert q.split(" , ") == [f"${i + 1}" for i in values]
+    assert params == values
+
+
+def test_renderer_continues_numbering():
+    renderer = Renderer()
+    assert renderer.render(sql(1, 2)) == ("$1 $2", [1, 2])
+    assert renderer.render(sql(3)) == ("$3", [3])
+
+
+def test_iadd():
+    block = raw("SELECT")
+    block += wrap(1)
+    block += sql(raw("FROM"), 2)
+    block += Parameter(3)
+
+    assert block.render() == ("SELECT ( $1 ) FROM $2 $3", [1, 2, 3])
+
+    with pytest.raises(TypeError):
+        block += 4
+
+
+def test_render_cache_evicts_oldest(mocker):
+    mocker.patch("apgorm.sql.sql._RENDER_CACHE_SIZE", 2)
+    mocker.patch.dict("apgorm.sql.sql._RENDER_CACHE", clear=True)
+
+    for name in ("a", "b", "c"):
+        sql(raw(name), 1).render()
+
+    assert list(_RENDER_CACHE) == [("b", None), ("c", None)]
+
+
+def test_raw_cache_is_typed():
+    assert raw(True).render() == ("True", [])
+    assert raw(1.0).render() == ("1.0", [])
+    assert raw(1).render() == ("1", [])
+
+
+class _SlowDict(dict):
+    # widens the windows in which another thread can change the size of the
+    # cache while it is being evicted from
+    def __iter__(self):
+        it = super().__iter__()
+        time.sleep(0.0001)
+        return it
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        time.sleep(0.0001)
+        return value
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        time.sleep(0.0001)
+
+
+def test_render_cache_threaded_eviction(mocker):
+    mocker.patch("apgorm.sql.sql._RENDER_CACHE_SIZE", 4)
+    mocker.patch("apgorm.sql.sql._RENDER_CACHE", _SlowDict())
+    errors: list[BaseException] = []
+
+    def work(n: int) -> None:
+        try:
+            for i in range(100):
+                sql(Raw(f"t{n}_{i}"), 1).render()
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []